@@ -1,8 +1,11 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import os
+from datetime import date
+
+# dashboard (pandas, numpy, numba, tsdownsample) is imported only on the
+# live-build path below; serving a prebuilt figure needs none of them
+from paths import figure_path, partition_mtime, partition_path
 
 # --- APP CONFIGURATION ---
 st.set_page_config(
@@ -11,156 +14,114 @@ st.set_page_config(
     layout="wide"
 )
 
+# Serialize figures with orjson, which encodes NumPy buffers in C;
+# st.plotly_chart goes through plotly.io.to_json and picks this up
+pio.json.config.default_engine = "orjson"
+
 # --- CONSTANTS ---
-DATA_PATH = "data/df_clean.csv"
+DATA_DIR = "data/by_date"
+FIGURES_DIR = "data/figures"
 
 # --- DATA LOADING ---
+def list_dates(path):
+    # Available days come from the partition directory names alone, so no
+    # data has to be read to populate the date picker
+    try:
+        names = os.listdir(path)
+    except FileNotFoundError:
+        st.error(f"Data directory not found at path: {path}")
+        return []
+
+    return sorted(
+        date.fromisoformat(name.split('=', 1)[1])
+        for name in names if name.startswith('date=')
+    )
+
 @st.cache_data
-def load_data(path):
+def load_data(path, selected_date, data_mtime):
+    # data_mtime is only part of the cache key: rewriting any of the
+    # partition's files changes it, so edited data is re-read without a
+    # restart
+    import pandas as pd
+    from dashboard import read_day
+
     try:
-        if not os.path.exists(path):
-            st.error(f"File not found at path: {path}")
-            return pd.DataFrame()
-
-        df = pd.read_csv(path)
-        
-        # FIX: Strip whitespace from column names to handle invisible spaces
-        df.columns = df.columns.str.strip()
-        
-        # Convert Timestamp to datetime
-        if 'Timestamp' in df.columns:
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'])
-        
-        # Calculate Scaling Delta if columns exist
-        if 'StackTempMbus' in df.columns and 'SteamTempMbus' in df.columns:
-            df['Scaling_Delta'] = df['StackTempMbus'] - df['SteamTempMbus']
-            
-        return df
+        return read_day(path, selected_date)
+    except FileNotFoundError:
+        st.error(f"File not found at path: {partition_path(path, selected_date)}")
+        return pd.DataFrame()
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return pd.DataFrame()
 
+# --- PLOTLY DASHBOARD ---
+@st.cache_resource
+def load_figure(path, figure_mtime):
+    # Figures are prebuilt by prepare_data.py, so serving a day is a file
+    # read; cache_resource keeps the parsed Figure instead of copying it
+    try:
+        return pio.read_json(path, engine="orjson")
+    except Exception as e:
+        st.error(f"Error loading figure {path}: {e}")
+        return None
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_figure(_df_filtered, data_mtime, selected_date):
+    # Fallback for days without a prebuilt figure. The day's frame is not
+    # hashed (leading underscore); the figure is keyed on the data file's
+    # mtime and the selected date instead, which determine its contents
+    from dashboard import make_figure
+    return make_figure(_df_filtered)
+
 # --- MAIN APP ---
 def main():
     st.title("🔥 Steam Axia Operational Dashboard")
     
-    # Load Data
-    with st.spinner('Loading data...'):
-        df = load_data(DATA_PATH)
-
-    if df.empty:
+    dates = list_dates(DATA_DIR)
+    if not dates:
         return
 
-    # DEBUG: Un-comment this if you still get errors to see exact column names
-    # st.write(df.columns.tolist())
-
     # Sidebar Filters
     st.sidebar.header("Filter Options")
-    
-    if 'Timestamp' in df.columns:
-        min_date = df['Timestamp'].min().date()
-        max_date = df['Timestamp'].max().date()
-        
-        selected_date = st.sidebar.date_input(
-            "Select Date",
-            value=min_date,
-            min_value=min_date,
-            max_value=max_date
-        )
-        
-        mask = (df['Timestamp'].dt.date == selected_date)
-        df_filtered = df.loc[mask]
-    else:
-        df_filtered = df
 
-    if df_filtered.empty:
+    selected_date = st.sidebar.date_input(
+        "Select Date",
+        value=dates[0],
+        min_value=dates[0],
+        max_value=dates[-1]
+    )
+
+    if selected_date not in dates:
         st.info("No data available for the selected date.")
         return
 
-    # --- PLOTLY DASHBOARD ---
-    fig = make_subplots(
-        rows=4, cols=1,
-        shared_xaxes=True,
-        vertical_spacing=0.03,
-        subplot_titles=(
-            "Air Flow % (Blower Damper)", 
-            "Tube Scaling Delta (TStack - TSteam)", 
-            "Steam Pressure", 
-            "Stack O2"
-        )
-    )
-
-    # 1. Air Flow (Formerly Channel 2)
-    damper_col = 'Air flow %'
-    if damper_col in df_filtered.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=df_filtered['Timestamp'], 
-                y=df_filtered[damper_col], 
-                name="Air Flow %",
-                line=dict(color='#2563eb', width=2),
-                fill='tozeroy',
-                fillcolor='rgba(37, 99, 235, 0.1)'
-            ),
-            row=1, col=1
-        )
+    # A few stat() calls per rerun key the caches on the files' mtimes
+    data_mtime = partition_mtime(DATA_DIR, selected_date)
+    fig_path = figure_path(FIGURES_DIR, selected_date)
+    fig_mtime = os.path.getmtime(fig_path) if os.path.exists(fig_path) else None
+
+    # The prebuilt figure is only trusted if it is at least as new as the
+    # day's data; otherwise the data changed since prepare_data.py ran
+    if fig_mtime is not None and fig_mtime >= data_mtime:
+        fig = load_figure(fig_path, fig_mtime)
+        if fig is None:
+            return
     else:
-        st.warning(f"Column '{damper_col}' not found. Available columns: {df.columns.tolist()}")
-
-    # 2. Tube Scaling
-    if 'Scaling_Delta' in df_filtered.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=df_filtered['Timestamp'], 
-                y=df_filtered['Scaling_Delta'], 
-                name="Scaling Delta (°C)",
-                line=dict(color='#dc2626', width=2)
-            ),
-            row=2, col=1
-        )
-
-    # 3. Pressure
-    if 'SteamPrMbus' in df_filtered.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=df_filtered['Timestamp'], 
-                y=df_filtered['SteamPrMbus'], 
-                name="Pressure (Bar)",
-                line=dict(color='#059669', width=2)
-            ),
-            row=3, col=1
-        )
-
-    # 4. Stack O2
-    if 'StackO2Mbus' in df_filtered.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=df_filtered['Timestamp'], 
-                y=df_filtered['StackO2Mbus'], 
-                name="Stack O2 %",
-                line=dict(color='#7c3aed', width=2)
-            ),
-            row=4, col=1
-        )
-
-    fig.update_layout(
-        height=900,
-        showlegend=True,
-        hovermode="x unified",
-        template="plotly_white",
-        margin=dict(l=20, r=20, t=60, b=20)
-    )
+        # Load Data
+        with st.spinner('Loading data...'):
+            df_filtered = load_data(DATA_DIR, selected_date, data_mtime)
 
-    fig.update_yaxes(title_text="Air Flow %", row=1, col=1)
-    fig.update_yaxes(title_text="Delta °C", row=2, col=1)
-    fig.update_yaxes(title_text="Bar", row=3, col=1)
-    fig.update_yaxes(title_text="O2 %", row=4, col=1)
+        if df_filtered.empty:
+            return
 
-    fig.update_xaxes(
-        tickformat="%H:%M",
-        title_text="Time (HH:MM)",
-        row=4, col=1
-    )
+        # DEBUG: Un-comment this if you still get errors to see exact column names
+        # st.write(df_filtered.columns.tolist())
+
+        from dashboard import DAMPER_COL
+        if DAMPER_COL not in df_filtered.columns:
+            st.warning(f"Column '{DAMPER_COL}' not found. Available columns: {df_filtered.columns.tolist()}")
+
+        fig = build_figure(df_filtered, data_mtime, selected_date)
 
     st.plotly_chart(fig, use_container_width=True)
 
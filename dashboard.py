@@ -0,0 +1,182 @@
+import pandas as pd
+import numpy as np
+
+from paths import partition_path
+
+# Day loading and figure construction, shared by the Streamlit app and by
+# prepare_data.py, which prebuilds every day's figure offline
+
+# --- CONSTANTS ---
+COLUMNS = [
+    'Timestamp',
+    'StackTempMbus',
+    'SteamTempMbus',
+    'SteamPrMbus',
+    'StackO2Mbus',
+    'Air flow %'
+]
+NUMERIC_COLS = [c for c in COLUMNS if c != 'Timestamp']
+DAMPER_COL = 'Air flow %'
+MAX_POINTS = 2000  # per trace, beyond this series are LTTB-downsampled
+
+# --- DATA LOADING ---
+def read_day(path, day):
+    # Only the given day's partition is read from disk. Parquet is
+    # columnar and typed: only the plotted columns are read and
+    # Timestamp arrives as datetime64, so no parsing is needed.
+    # Column names are already canonicalized by prepare_data.py.
+    df = pd.read_parquet(partition_path(path, day), engine="pyarrow", columns=COLUMNS)
+
+    # Keep Timestamp as a sorted DatetimeIndex: time slicing becomes a
+    # binary search and LTTB gets the monotonic x axis it requires
+    df = df.set_index('Timestamp').sort_index()
+
+    # float32 keeps ~7 significant digits, plenty for the plots, and
+    # halves the bytes held in memory and streamed to Plotly
+    df = df.astype({c: 'float32' for c in NUMERIC_COLS if c in df.columns})
+
+    # Calculate Scaling Delta if columns exist
+    if 'StackTempMbus' in df.columns and 'SteamTempMbus' in df.columns:
+        # numba is only imported (and its threading layer configured) here
+        from kernels import scaling_delta
+
+        # Subtract the raw arrays directly: both columns share the same
+        # index, so pandas' alignment pass would be wasted work
+        stack = df['StackTempMbus'].to_numpy(copy=False)
+        steam = df['SteamTempMbus'].to_numpy(copy=False)
+        out = np.empty(len(df), dtype=np.float32)
+        scaling_delta(stack, steam, out)
+        df['Scaling_Delta'] = out
+
+    return df
+
+# --- PLOT HELPERS ---
+def downsample(x, y, n_out=MAX_POINTS):
+    # Largest-Triangle-Three-Buckets keeps the visual shape of a series
+    # while capping the number of points Plotly has to render and hover
+    if len(x) <= n_out:
+        return x, y
+
+    from tsdownsample import NaNMinMaxLTTBDownsampler
+
+    # The NaN-aware variant keeps NaN samples in its selection, so sensor
+    # outages stay gaps (connectgaps=False) exactly as on smaller days
+    idx = NaNMinMaxLTTBDownsampler().downsample(x, y, n_out=n_out)
+    return x[idx], y[idx]
+
+# --- PLOTLY DASHBOARD ---
+def make_figure(df):
+    # plotly.subplots is only needed when a figure is actually built, so
+    # serving a prebuilt figure never imports it
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    # Plotly serializes ndarrays as typed buffers; pandas Series would be
+    # validated and coerced element by element first. Timestamps go out as
+    # epoch milliseconds (the unit of Plotly date axes): each trace's x is
+    # encoded as a float64 buffer, about a third smaller than the ISO
+    # strings datetime64 turns into.
+    ts = df.index.to_numpy().astype('datetime64[ms]').astype('float64')
+
+    # Pull each plotted column out once as a local NumPy view, so the
+    # trace code below never goes back through pandas' column lookup
+    cols = df.columns
+    y_air = df[DAMPER_COL].to_numpy() if DAMPER_COL in cols else None
+    y_sd = df['Scaling_Delta'].to_numpy() if 'Scaling_Delta' in cols else None
+    y_pr = df['SteamPrMbus'].to_numpy() if 'SteamPrMbus' in cols else None
+    y_o2 = df['StackO2Mbus'].to_numpy() if 'StackO2Mbus' in cols else None
+
+    fig = make_subplots(
+        rows=4, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.03,
+        subplot_titles=(
+            "Air Flow % (Blower Damper)", 
+            "Tube Scaling Delta (TStack - TSteam)", 
+            "Steam Pressure", 
+            "Stack O2"
+        )
+    )
+
+    # Traces are collected and added in one call: every add_trace
+    # re-validates the figure, add_traces does so once
+    traces, rows = [], []
+
+    # 1. Air Flow (Formerly Channel 2)
+    if y_air is not None:
+        x, y = downsample(ts, y_air)
+        traces.append(
+            go.Scattergl(
+                x=x, 
+                y=y, 
+                name="Air Flow %",
+                line=dict(color='#2563eb', width=2),
+                fill='tozeroy',
+                fillcolor='rgba(37, 99, 235, 0.1)'
+            )
+        )
+        rows.append(1)
+
+    # 2. Tube Scaling
+    if y_sd is not None:
+        x, y = downsample(ts, y_sd)
+        traces.append(
+            go.Scattergl(
+                x=x, 
+                y=y, 
+                name="Scaling Delta (°C)",
+                line=dict(color='#dc2626', width=2)
+            )
+        )
+        rows.append(2)
+
+    # 3. Pressure
+    if y_pr is not None:
+        x, y = downsample(ts, y_pr)
+        traces.append(
+            go.Scattergl(
+                x=x, 
+                y=y, 
+                name="Pressure (Bar)",
+                line=dict(color='#059669', width=2)
+            )
+        )
+        rows.append(3)
+
+    # 4. Stack O2
+    if y_o2 is not None:
+        x, y = downsample(ts, y_o2)
+        traces.append(
+            go.Scattergl(
+                x=x, 
+                y=y, 
+                name="Stack O2 %",
+                line=dict(color='#7c3aed', width=2)
+            )
+        )
+        rows.append(4)
+
+    fig.add_traces(traces, rows=rows, cols=[1] * len(rows))
+
+    fig.update_layout(
+        height=900,
+        showlegend=True,
+        hovermode="x unified",
+        template="plotly_white",
+        margin=dict(l=20, r=20, t=60, b=20)
+    )
+
+    fig.update_yaxes(title_text="Air Flow %", row=1, col=1)
+    fig.update_yaxes(title_text="Delta °C", row=2, col=1)
+    fig.update_yaxes(title_text="Bar", row=3, col=1)
+    fig.update_yaxes(title_text="O2 %", row=4, col=1)
+
+    # Axis type must be explicit, numeric x would otherwise be linear
+    fig.update_xaxes(type='date')
+    fig.update_xaxes(
+        tickformat="%H:%M",
+        title_text="Time (HH:MM)",
+        row=4, col=1
+    )
+
+    return fig
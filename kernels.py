@@ -0,0 +1,15 @@
+from numba import config, njit, prange
+
+# Numba kernels, imported lazily by dashboard.read_day so code paths that
+# never compute Scaling_Delta don't pay for importing and compiling them
+
+# Streamlit runs sessions in worker threads; prefer the OpenMP pool for
+# parallel kernels, the TBB layer can hang on interpreter shutdown there
+config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+@njit(parallel=True, cache=True)
+def scaling_delta(stack, steam, out):
+    # Multi-threaded subtract into a preallocated buffer. fastmath is left
+    # off on purpose: it assumes no NaNs and the sensor data has gaps.
+    for i in prange(stack.size):
+        out[i] = stack[i] - steam[i]
@@ -0,0 +1,21 @@
+import os
+
+# On-disk layout written by prepare_data.py. Kept free of heavy imports so
+# the app can locate and stat files before loading pandas or numba.
+
+def partition_path(path, day):
+    # One Parquet partition per calendar day
+    return os.path.join(path, f"date={day.isoformat()}")
+
+def partition_mtime(path, day):
+    # Newest mtime of the partition's data files. The directory's own mtime
+    # only changes when files are added or removed, not rewritten in place.
+    with os.scandir(partition_path(path, day)) as entries:
+        return max(
+            (e.stat().st_mtime for e in entries if e.name.endswith('.parquet')),
+            default=0.0
+        )
+
+def figure_path(path, day):
+    # ...and one prebuilt Plotly figure per calendar day
+    return os.path.join(path, f"{day.isoformat()}.json")
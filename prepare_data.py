@@ -0,0 +1,75 @@
+import pandas as pd
+import os
+from datetime import date
+
+from dashboard import make_figure, read_day
+from paths import figure_path
+
+# --- CONSTANTS ---
+CSV_PATH = "data/df_clean.csv"
+DATA_DIR = "data/by_date"
+FIGURES_DIR = "data/figures"
+USECOLS = [
+    'Timestamp',
+    'StackTempMbus',
+    'SteamTempMbus',
+    'SteamPrMbus',
+    'StackO2Mbus',
+    'Air flow %'
+]
+DTYPES = {c: 'float32' for c in USECOLS if c != 'Timestamp'}
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# --- CONVERSION ---
+def convert(csv_path, data_dir):
+    # Match the wanted columns against the header with whitespace stripped,
+    # since the raw names may carry invisible spaces
+    header = pd.read_csv(csv_path, nrows=0).columns
+    raw_names = {c.strip(): c for c in header}
+    usecols = [raw_names[c] for c in USECOLS]
+
+    # pyarrow's multi-threaded reader only materializes the requested
+    # columns and parses them straight into float32 / datetime64. The
+    # fixed Timestamp format goes to pyarrow's C strptime parser instead
+    # of per-row format inference.
+    df = pd.read_csv(
+        csv_path,
+        usecols=usecols,
+        dtype={raw_names[c]: t for c, t in DTYPES.items()},
+        parse_dates=[raw_names['Timestamp']],
+        date_format=TIMESTAMP_FORMAT,
+        engine="pyarrow"
+    )
+
+    # Strip whitespace from column names to handle invisible spaces
+    df.columns = df.columns.str.strip()
+
+    # Partition by calendar day so the app reads only the selected day,
+    # e.g. data/by_date/date=2026-01-30/part-0.parquet
+    df = df.sort_values('Timestamp')
+    df['date'] = df['Timestamp'].dt.strftime('%Y-%m-%d')
+    df.to_parquet(
+        data_dir,
+        engine="pyarrow",
+        index=False,
+        partition_cols=['date'],
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching"
+    )
+    print(f"Wrote {len(df)} rows for {df['date'].nunique()} days to {data_dir}")
+
+    return [date.fromisoformat(d) for d in df['date'].unique()]
+
+# --- FIGURES ---
+def build_figures(data_dir, figures_dir, days):
+    # The chart only depends on the selected day, so every day's figure is
+    # built here once and the app just reads the JSON back
+    os.makedirs(figures_dir, exist_ok=True)
+    for day in days:
+        fig = make_figure(read_day(data_dir, day))
+        fig.write_json(figure_path(figures_dir, day), engine="orjson")
+    print(f"Wrote {len(days)} figures to {figures_dir}")
+
+if __name__ == "__main__":
+    days = convert(CSV_PATH, DATA_DIR)
+    build_figures(DATA_DIR, FIGURES_DIR, days)